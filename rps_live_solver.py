@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+import numpy as np
+
 # --- 1. CONFIGURATION ---
 GESTURES = ["rock", "paper", "scissors"]
 GESTURE_ID_MAP = {
@@ -5,188 +8,402 @@ GESTURE_ID_MAP = {
     1: 'paper', 
     2: 'scissors'
 }
+# Display names indexed by gesture id, only used when printing results
+_GESTURE_LABELS = tuple(GESTURE_ID_MAP[g].capitalize() for g in range(len(GESTURE_ID_MAP)))
 YOLO_MODEL_PATH = "best.pt"  # Your model file
+YOLO_IMAGE_SIZE = 640  # Input size the TensorRT engine is built for
+YOLO_BATCH_SIZE = 4  # Images per forward pass in batched detection
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".avi", ".mkv", ".webm")
+
+# Integer codes stored in HandBatch.player / HandBatch.side
+PLAYER_UNASSIGNED, PLAYER_OPPONENT, PLAYER_MINE = -1, 0, 1
+SIDE_UNASSIGNED, SIDE_LEFT, SIDE_RIGHT = -1, 0, 1
 
 # --- 2. HAND DATA STRUCTURE ---
-class Hand:
-    """Represents a single detected hand gesture with its location."""
-    def __init__(self, gesture_id, x_center, y_center, width, height):
-        self.gesture_id = gesture_id
-        self.x_center = x_center
-        self.y_center = y_center
-        self.width = width
-        self.height = height
-        self.player = None  
-        self.side = None    
+@dataclass
+class HandBatch:
+    """All detected hand gestures in one image, stored as parallel arrays (one row per hand)."""
+    xywh: np.ndarray    # (N, 4) float32: x_center, y_center, width, height (normalized 0-1)
+    gid: np.ndarray     # (N,) int32 gesture ids (keys of GESTURE_ID_MAP)
+    player: np.ndarray  # (N,) int8 PLAYER_* codes, filled in by the solver
+    side: np.ndarray    # (N,) int8 SIDE_* codes, filled in by the solver
+
+    @classmethod
+    def from_arrays(cls, xywh, gid):
+        n = len(gid)
+        return cls(
+            xywh=np.asarray(xywh, dtype=np.float32).reshape(n, 4),
+            gid=np.asarray(gid, dtype=np.int32),
+            player=np.full(n, PLAYER_UNASSIGNED, dtype=np.int8),
+            side=np.full(n, SIDE_UNASSIGNED, dtype=np.int8),
+        )
+
+    @classmethod
+    def empty(cls):
+        return cls.from_arrays(np.empty((0, 4)), np.empty(0))
+
+    def __len__(self):
+        return len(self.gid)
 
 # --- 3. GAME LOGIC FUNCTIONS ---
 def beats(a, b):
-    # RPS win logic
-    return (a == "rock" and b == "scissors") or \
-           (a == "scissors" and b == "paper") or \
-           (a == "paper" and b == "rock")
+    # RPS win logic on gesture ids (0=rock, 1=paper, 2=scissors): each id beats the one before it
+    return (a - b) % 3 == 1
 
-def remove_gesture(my_hand, opp_hand):
+# Placeholders in the removal table for hands the rules don't decide
+_RULE_VIOLATION = -1  # common gesture but not exactly 2 distinct gestures each
+_NO_COMMON = -2       # no gesture in common with the opponent
+
+def _remove_gesture_rules(my_hand, opp_hand):
     # Your complex RPS-Minus-One removal logic (Rules 2, 3, 4)
-    # ... (Keep the original implementation here) ...
-    my_set = set(my_hand)
-    opp_set = set(opp_hand)
-
-    common = list(my_set & opp_set)
-    my_unique = list(my_set - opp_set)
-    opp_unique = list(opp_set - my_set)
-
-    if len(common) == 2:
-        a, b = list(my_set)
-        if beats(a, b):
-            return b
+    # Hands are pairs of gesture ids; returns the gesture id to remove (or a placeholder above)
+    a1, a2 = sorted(my_hand)
+    b1, b2 = sorted(opp_hand)
+
+    # Both gestures in common → remove the one that loses
+    if a1 == b1 and a2 == b2 and a1 != a2:
+        if beats(a1, a2):
+            return a2
         else:
-            return a
-
-    if len(common) == 1:
-        
-        # --- FIX: Ensure unique lists have exactly one element ---
-        if len(my_unique) != 1 or len(opp_unique) != 1:
-            print("WARNING: Player hand input violates game rules (not exactly 2 distinct gestures). Falling back to arbitrary choice.")
-            return random.choice(my_hand)
-        # --------------------------------------------------------
-
-        common_gesture = common[0]
-        my_nc = my_unique[0]
-        opp_nc = opp_unique[0]
-
-        # Rule 2 — your non-common wins → remove your non-common
-        if beats(my_nc, opp_nc):
-            return my_nc
-
-        # Rule 4 — your non-common loses → remove common gesture
-        if beats(opp_nc, my_nc):
-            return common_gesture
-
-    # Handle the "No common gesture" case (len(common) == 0)
-    if len(common) == 0:
+            return a1
+
+    # Find the common gesture and your non-common gesture
+    if a1 == b1 or a1 == b2:
+        common_gesture, my_nc = a1, a2
+    elif a2 == b1 or a2 == b2:
+        common_gesture, my_nc = a2, a1
+    else:
+        # Handle the "No common gesture" case
         # If your set is {R, P} and opp set is {S, C} (impossible in RPS), 
         # but if your set is {R, P} and opp set is {S, C} this block will be hit.
         # Your original code falls back here, so we add a specific rule for this.
         # A common default is to remove the hand that loses to the opponent's best hand.
+        return _NO_COMMON
+
+    # --- FIX: Ensure both players show exactly 2 distinct gestures ---
+    if a1 == a2 or b1 == b2:
+        return _RULE_VIOLATION
+    # --------------------------------------------------------
+
+    opp_nc = b2 if common_gesture == b1 else b1
+
+    # Rule 2 — your non-common wins → remove your non-common
+    if beats(my_nc, opp_nc):
+        return my_nc
+
+    # Rule 4 — your non-common loses → remove common gesture
+    if beats(opp_nc, my_nc):
+        return common_gesture
+
+    return 0 # Fallback (arbitrary choice: rock)
+
+# Only 9 x 9 possible (my hand, opponent hand) pairs, so run the rules once for each at import.
+# A pair of gesture ids (a, b) is encoded as row/column 3 * a + b.
+_REMOVE_TABLE = np.array(
+    [[_remove_gesture_rules([my_a, my_b], [opp_a, opp_b])
+      for opp_a in range(3) for opp_b in range(3)]
+     for my_a in range(3) for my_b in range(3)],
+    dtype=np.int8,
+)
+
+def remove_gesture(my_hand, opp_hand):
+    # Table lookup of _remove_gesture_rules; returns the gesture id to remove
+    if len(my_hand) != 2 or len(opp_hand) != 2:
+        raise ValueError(f"Each player must show exactly two hands, got {len(my_hand)} and {len(opp_hand)}")
+    choice = int(_REMOVE_TABLE[3 * my_hand[0] + my_hand[1], 3 * opp_hand[0] + opp_hand[1]])
+
+    if choice == _RULE_VIOLATION:
+        print("WARNING: Player hand input violates game rules (not exactly 2 distinct gestures). Falling back to arbitrary choice.")
+        return random.choice(my_hand)
+    if choice == _NO_COMMON:
         return random.choice(my_hand) # Arbitrary choice for non-standard case
 
-    return 'rock' # Fallback (arbitrary choice)
+    return choice
+
+def _as_gesture_pairs(hands, name):
+    # Validates an (N, 2) array of gesture ids before it is used to index _REMOVE_TABLE
+    hands = np.asarray(hands)
+    if hands.ndim != 2 or hands.shape[1] != 2:
+        raise ValueError(f"{name} must have shape (N, 2), got {hands.shape}")
+    if hands.size and not np.issubdtype(hands.dtype, np.integer):
+        raise ValueError(f"{name} must hold integer gesture ids, got dtype {hands.dtype}")
+    if hands.size and (hands.min() < 0 or hands.max() >= len(GESTURE_ID_MAP)):
+        raise ValueError(f"{name} must hold gesture ids in range({len(GESTURE_ID_MAP)})")
+    return hands.astype(np.int8)
+
+def remove_gesture_batch(my_hands, opp_hands):
+    """
+    Vectorized remove_gesture for offline analysis of many games.
+    my_hands and opp_hands are (N, 2) arrays of gesture ids; returns an (N,) int8 array
+    of gesture ids to remove. Undecided games pick one of your hands at random (no warning).
+    Raises ValueError for malformed input or ids outside GESTURE_ID_MAP.
+    """
+    my_hands = _as_gesture_pairs(my_hands, "my_hands")
+    opp_hands = _as_gesture_pairs(opp_hands, "opp_hands")
+    if len(my_hands) != len(opp_hands):
+        raise ValueError(f"my_hands and opp_hands must have the same length, got {len(my_hands)} and {len(opp_hands)}")
+
+    choice = _REMOVE_TABLE[3 * my_hands[:, 0] + my_hands[:, 1], 3 * opp_hands[:, 0] + opp_hands[:, 1]]
+
+    undecided = np.flatnonzero(choice < 0)
+    if len(undecided):
+        picks = np.random.randint(0, 2, size=len(undecided))
+        choice[undecided] = my_hands[undecided, picks]
+
+    return choice
 # ----------------------------------------------------
 
-from ultralytics import YOLO
-import argparse
+# Heavy libraries (ultralytics, torch, av, PIL) are imported where they are used,
+# so importing this file for the game logic alone stays fast
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
 import random
+import weakref
 
 # --- 4. DATA EXTRACTION AND PARSING (New Function) ---
 
+# Models compiled for a fixed square input; every other model keeps minimal-rectangle letterboxing
+_SQUARE_INPUT_MODELS = weakref.WeakSet()
+
+@functools.lru_cache(maxsize=2)
+def _get_model(model_path):
+    # Load the weights once per path; later calls reuse the same YOLO object
+    import torch
+    from ultralytics import YOLO
+
+    if not torch.cuda.is_available():
+        return _prepare_torch_model(YOLO(model_path))  # TensorRT needs CUDA, stay on the PyTorch weights
+
+    # Export a TensorRT FP16 engine next to the .pt on first run, then reuse it.
+    # The export settings are part of the file name, so changing them builds a new engine.
+    engine_path = f"{os.path.splitext(model_path)[0]}_fp16_{YOLO_IMAGE_SIZE}_b{YOLO_BATCH_SIZE}.engine"
+    try:
+        if not os.path.exists(engine_path) or os.path.getmtime(engine_path) < os.path.getmtime(model_path):
+            print(f"Exporting {model_path} to TensorRT engine {engine_path} (first run or retrained weights)...")
+            exported_path = YOLO(model_path).export(
+                format="engine", half=True, imgsz=YOLO_IMAGE_SIZE,
+                dynamic=True, batch=YOLO_BATCH_SIZE,  # engine must accept batched input too
+            )
+            os.replace(exported_path, engine_path)
+
+        model = YOLO(engine_path, task="detect")
+        # Deserialize the engine now, so one built for another TensorRT version or GPU fails here, not on the first real frame
+        _predict(model, np.zeros((YOLO_IMAGE_SIZE, YOLO_IMAGE_SIZE, 3), dtype=np.uint8))
+        return model
+    except Exception as e:
+        print(f"WARNING: TensorRT engine unavailable, using {model_path} instead. Details: {e}")
+        return _prepare_torch_model(YOLO(model_path))
+
+def _prepare_torch_model(model):
+    # Specialize PyTorch (.pt) weights for the fixed input size and pay the setup cost at startup
+    import torch
+
+    model.fuse()  # Fold BatchNorm into the preceding convolutions
+    warmup = np.zeros((YOLO_IMAGE_SIZE, YOLO_IMAGE_SIZE, 3), dtype=np.uint8)
+    _predict(model, warmup)  # Builds the predictor and its backend
+
+    backend = model.predictor.model
+    if torch.cuda.is_available() and getattr(backend, "pt", False):
+        eager = backend.model
+        # Channels-last FP16 weights map convolutions onto tensor cores more efficiently
+        backend.model = eager.to(memory_format=torch.channels_last).half()
+        # Default mode (no CUDA graphs), so the compiled model can also run on the video worker thread
+        backend.model = torch.compile(backend.model, dynamic=False)
+        _SQUARE_INPUT_MODELS.add(model)
+        try:
+            # Trigger compilation now rather than on the first real frame. _predict letterboxes this
+            # model to a square YOLO_IMAGE_SIZE input, so only the batch size can vary:
+            # compile every size a single image, a full batch or a tail batch can arrive with.
+            for batch in range(1, YOLO_BATCH_SIZE + 1):
+                _predict(model, [warmup] * batch, batch=batch)
+        except Exception as e:
+            print(f"WARNING: torch.compile failed, running the model uncompiled. Details: {e}")
+            backend.model = eager
+            _SQUARE_INPUT_MODELS.discard(model)
+
+    return model
+
+def _predict(model, source, stream=False, **kwargs):
+    # Shared YOLO call: FP16 on the first GPU when CUDA is available, FP32 on CPU otherwise
+    import torch
+
+    if torch.cuda.is_available():
+        kwargs.update(half=True, device=0)
+    if model in _SQUARE_INPUT_MODELS:
+        # rect=False letterboxes every image to the same square size, matching the compiled shapes
+        kwargs.update(imgsz=YOLO_IMAGE_SIZE, rect=False)
+    if stream:
+        # Generator that yields results one at a time, so only the current batch's images are held in memory.
+        # Not wrapped in inference_mode: that would stay active in the caller's thread between results,
+        # and Ultralytics' predictor already enters inference mode around each step itself.
+        return model(source, verbose=False, stream=True, **kwargs)
+    with torch.inference_mode():  # No autograd bookkeeping, without touching the caller's grad mode
+        return model(source, verbose=False, **kwargs)
+
 def detect_hands(image_path, model_path, gesture_map):
     """
-    Loads the YOLO model, runs inference on the image, and converts results 
-    into a list of Hand objects using normalized coordinates.
+    Runs inference on the image with the (cached) YOLO model and converts results 
+    into a HandBatch using normalized coordinates.
     """
     try:
-        model = YOLO(model_path)
+        model = _get_model(model_path)
     except Exception as e:
         print(f"Error loading model from {model_path}. Ensure 'ultralytics' is installed and the file exists.")
         print(f"Details: {e}")
-        return []
+        return HandBatch.empty()
 
     # Run inference
-    results = model(image_path, verbose=False) 
-    
-    hands = []
+    # classes= drops other classes inside NMS, before results come back to Python
+    results = _predict(model, image_path, classes=list(gesture_map))
     
     # Assuming batch size of 1, process the first result object
-    if results and results[0].boxes:
-        r = results[0]
-        img_width, img_height = r.orig_shape # Get the original image size
-
-        for box in r.boxes:
-            # box.xywhn returns: [x_center, y_center, width, height] (normalized 0-1)
-            x_c_norm, y_c_norm, w_norm, h_norm = box.xywhn[0].tolist() 
-            class_id = int(box.cls[0].item())
-
-            # Only process if the class ID is in our defined map
-            if class_id in gesture_map:
-                hands.append(Hand(
-                    gesture_id=class_id,
-                    x_center=x_c_norm,
-                    y_center=y_c_norm,
-                    width=w_norm,
-                    height=h_norm
-                ))
-    
-    return hands
+    if results:
+        return _result_to_hands(results[0])
+    return HandBatch.empty()
+
+def _result_to_hands(r):
+    """Converts a single YOLO result object into a HandBatch."""
+    if not r.boxes:
+        return HandBatch.empty()
+
+    # One bulk device->host copy of the raw (N, 6) [x1, y1, x2, y2, conf, cls] tensor
+    data = r.boxes.data.cpu().numpy()
+    img_height, img_width = r.orig_shape  # Get the original image size
+
+    # Convert pixel xyxy to [x_center, y_center, width, height] (normalized 0-1)
+    x1, y1, x2, y2 = data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+    xywhn = np.column_stack((
+        (x1 + x2) * 0.5 / img_width,
+        (y1 + y2) * 0.5 / img_height,
+        (x2 - x1) / img_width,
+        (y2 - y1) / img_height,
+    ))
+    class_ids = data[:, 5].astype(np.int32)
+    return HandBatch.from_arrays(xywhn, class_ids)
+
+def _aspect_ratio(image):
+    if isinstance(image, np.ndarray):
+        height, width = image.shape[:2]  # Already-decoded frame
+        return width / height
+
+    # Only reads the image header, not the pixel data
+    from PIL import Image
+    with Image.open(image) as img:
+        width, height = img.size
+        # EXIF orientations 5-8 are rotated by 90 degrees; OpenCV applies this when decoding
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):
+            width, height = height, width
+    return width / height
+
+def _iter_frame_batches(video_path, batch=YOLO_BATCH_SIZE):
+    """Decodes a video with PyAV and yields lists of up to `batch` BGR frames."""
+    import av
+
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"  # Let FFmpeg decode with multiple threads
+
+        frames = []
+        for frame in container.decode(stream):
+            frames.append(frame.to_ndarray(format="bgr24"))  # Same layout OpenCV/YOLO expect
+            if len(frames) == batch:
+                yield frames
+                frames = []
+        if frames:
+            yield frames
+
+def detect_hands_batch(image_paths, model, gesture_map, batch=YOLO_BATCH_SIZE):
+    """
+    Runs batched inference over many images with an already-loaded YOLO model.
+    image_paths may also hold decoded BGR frames (numpy arrays).
+    Returns a list of HandBatch objects, aligned with image_paths.
+    """
+    if not image_paths:
+        return []
+
+    # Group images of similar shape into the same batch to minimize letterbox padding
+    # (pointless for square-input models, where every image is padded to the same size)
+    if model in _SQUARE_INPUT_MODELS:
+        order = list(range(len(image_paths)))
+    else:
+        order = sorted(range(len(image_paths)), key=lambda i: _aspect_ratio(image_paths[i]))
+    sorted_paths = [image_paths[i] for i in order]
+
+    # stream=True converts each result as it arrives instead of keeping every full-size image around
+    results = _predict(model, sorted_paths, stream=True, batch=batch, classes=list(gesture_map))
+
+    all_hands = [None] * len(image_paths)
+    for i, r in zip(order, results):
+        all_hands[i] = _result_to_hands(r)
+
+    return all_hands
 
 # --- 5. RPS Solver Class (Same as before) ---
 class RPSCustomSolver:
     
     def __init__(self, hands):
         self.hands = hands
-        self.gesture_names = GESTURE_ID_MAP 
 
     def _assign_hands_to_players(self):
         # ... (Same logic as before to assign 'MINE', 'OPPONENT', 'LEFT', 'RIGHT')
-        opponent_hands = []
-        my_hands = []
-        
-        for hand in self.hands:
-            # Y-center < 0.5 (top half) is OPPONENT, Y-center > 0.5 (bottom half) is MINE
-            if hand.y_center < 0.5: 
-                hand.player = 'OPPONENT'
-                opponent_hands.append(hand)
-            else:
-                hand.player = 'MINE'
-                my_hands.append(hand)
-
-        my_hands.sort(key=lambda h: h.x_center)
-        if len(my_hands) >= 2:
-            my_hands[0].side = 'LEFT'
-            my_hands[1].side = 'RIGHT'
-        
-        opponent_hands.sort(key=lambda h: h.x_center)
-        
-        self.opponent_hands = opponent_hands
-        self.my_hands = my_hands
+        hands = self.hands
+        x_center = hands.xywh[:, 0]
+
+        # Y-center < 0.5 (top half) is OPPONENT, Y-center >= 0.5 (bottom half) is MINE
+        hands.player = np.where(hands.xywh[:, 1] >= 0.5, PLAYER_MINE, PLAYER_OPPONENT).astype(np.int8)
+
+        # Indices of each player's hands, ordered left to right (each player sorted separately)
+        my_idx = np.flatnonzero(hands.player == PLAYER_MINE)
+        opponent_idx = np.flatnonzero(hands.player == PLAYER_OPPONENT)
+        self.my_idx = my_idx[np.argsort(x_center[my_idx], kind="stable")]
+        self.opponent_idx = opponent_idx[np.argsort(x_center[opponent_idx], kind="stable")]
+
+        hands.side = np.full(len(hands), SIDE_UNASSIGNED, dtype=np.int8)
+        if len(self.my_idx) >= 2:
+            hands.side[self.my_idx[:2]] = (SIDE_LEFT, SIDE_RIGHT)
 
 
     def solve(self):
         self._assign_hands_to_players()
         
-        if len(self.opponent_hands) < 2 or len(self.my_hands) < 2:
-            return f"Error: Model detected {len(self.opponent_hands)} opponent hand(s) and {len(self.my_hands)} of your hand(s). Need two of each for the game."
+        # Exactly two each: a third (e.g. false-positive) hand would otherwise be silently ignored
+        if len(self.opponent_idx) != 2 or len(self.my_idx) != 2:
+            return f"Error: Model detected {len(self.opponent_idx)} opponent hand(s) and {len(self.my_idx)} of your hand(s). Need exactly two of each for the game."
 
-        # Convert detected Hands into lists of gesture strings
-        my_gesture_names = [self.gesture_names[h.gesture_id] for h in self.my_hands]
-        opp_gesture_names = [self.gesture_names[h.gesture_id] for h in self.opponent_hands]
+        # Gesture ids of each player's hands, left to right
+        my_gesture_ids = self.hands.gid[self.my_idx].tolist()
+        opp_gesture_ids = self.hands.gid[self.opponent_idx].tolist()
         
         # 1. Determine which hand to remove using your custom logic
-        gesture_to_remove = remove_gesture(my_gesture_names, opp_gesture_names)
+        gesture_to_remove = remove_gesture(my_gesture_ids, opp_gesture_ids)
 
         # 2. Find which physical hand (Left/Right) corresponds to the gesture to remove
         hand_to_remove_side = None
         
+        g0, g1 = my_gesture_ids[0], my_gesture_ids[1]
+        
         # We must handle the case where the gestures are identical
-        if self.gesture_names[self.my_hands[0].gesture_id] == gesture_to_remove and self.gesture_names[self.my_hands[1].gesture_id] == gesture_to_remove:
+        if g0 == g1 == gesture_to_remove:
             # Both hands are the gesture to remove (e.g., if the logic returns 'rock' but you only have 'paper', 'scissors')
             # This is technically an error state based on your rules, but we must choose one.
              hand_to_remove_side = 'LEFT' # Arbitrarily remove left
-        elif self.gesture_names[self.my_hands[0].gesture_id] == gesture_to_remove:
+        elif g0 == gesture_to_remove:
             hand_to_remove_side = 'LEFT'
-        elif self.gesture_names[self.my_hands[1].gesture_id] == gesture_to_remove:
+        elif g1 == gesture_to_remove:
             hand_to_remove_side = 'RIGHT'
         
 
         if hand_to_remove_side is None:
-             return f"Logic Error: Could not find the physical hand matching the required removal gesture: **{gesture_to_remove}**"
+             return f"Logic Error: Could not find the physical hand matching the required removal gesture: **{_GESTURE_LABELS[gesture_to_remove]}**"
 
-        # 3. Formulate the final instruction
+        # 3. Formulate the final instruction (the only place gesture names are needed)
         result_message = (
             f"\n--- Game Analysis ---\n"
-            f"Your hands: {my_gesture_names[0].capitalize()} (Left), {my_gesture_names[1].capitalize()} (Right)\n"
-            f"Opponent's hands: {opp_gesture_names[0].capitalize()}, {opp_gesture_names[1].capitalize()}\n"
-            f"Custom Logic Determined Remove: {gesture_to_remove.capitalize()}\n"
+            f"Your hands: {_GESTURE_LABELS[g0]} (Left), {_GESTURE_LABELS[g1]} (Right)\n"
+            f"Opponent's hands: {_GESTURE_LABELS[opp_gesture_ids[0]]}, {_GESTURE_LABELS[opp_gesture_ids[1]]}\n"
+            f"Custom Logic Determined Remove: {_GESTURE_LABELS[gesture_to_remove]}\n"
             f"ACTION: REMOVE your {hand_to_remove_side} hand."
         )
         
@@ -194,11 +411,77 @@ class RPSCustomSolver:
 
 # --- 6. MAIN EXECUTION ---
 
+def _print_frame_solutions(all_hands, frame_index):
+    # Solves and prints each frame of a batch; returns the index of the next frame
+    for hands in all_hands:
+        print(f"\n=== Frame {frame_index} ===")
+        frame_index += 1
+        if not hands:
+            print("No hands were detected in the frame.")
+            continue
+        print(RPSCustomSolver(hands).solve())
+    return frame_index
+
+def _configure_torch_backends():
+    # Process-wide settings, so only the CLI applies them (not code importing this module)
+    import torch
+
+    # Let cuDNN pick the fastest kernels for the fixed input size
+    torch.backends.cudnn.benchmark = True
+    # Allow TF32 tensor-core math for any FP32 work left on Ampere+ GPUs
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Rock-Paper-Scissors-Minus-One Solver.")
-    parser.add_argument("image_path", type=str, help="Path to the input image file (e.g., my_game_image.jpg).")
+    parser.add_argument("image_path", type=str, help="Path to the input image file (e.g., my_game_image.jpg), a directory of images, or a video file.")
     args = parser.parse_args()
 
+    # 0. Load the model once up front so detection reuses it
+    try:
+        _configure_torch_backends()
+        model = _get_model(YOLO_MODEL_PATH)
+    except Exception as e:
+        print(f"Error loading model from {YOLO_MODEL_PATH}. Ensure 'ultralytics' is installed and the file exists.")
+        print(f"Details: {e}")
+        return
+
+    # Directory input: run every image through the model in batches
+    if os.path.isdir(args.image_path):
+        image_paths = sorted(
+            os.path.join(args.image_path, f) for f in os.listdir(args.image_path)
+            if f.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        print(f"Running batched detection on {len(image_paths)} image(s) in {args.image_path} using model {YOLO_MODEL_PATH}...")
+        all_hands = detect_hands_batch(image_paths, model, GESTURE_ID_MAP)
+
+        for image_path, hands in zip(image_paths, all_hands):
+            print(f"\n=== {image_path} ===")
+            if not hands:
+                print("No hands were detected in the image.")
+                continue
+            print(RPSCustomSolver(hands).solve())
+        return
+
+    # Video input: decode frames with PyAV and feed them to the model in batches
+    if args.image_path.lower().endswith(VIDEO_EXTENSIONS):
+        print(f"Running batched detection on video {args.image_path} using model {YOLO_MODEL_PATH}...")
+        frame_index = 0
+
+        # Inference for batch N runs on a worker thread while batch N-1 is solved and printed here
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = None
+            for frames in _iter_frame_batches(args.image_path):
+                previous = pending.result() if pending is not None else None
+                pending = pool.submit(detect_hands_batch, frames, model, GESTURE_ID_MAP)
+                if previous is not None:
+                    frame_index = _print_frame_solutions(previous, frame_index)
+            if pending is not None:
+                _print_frame_solutions(pending.result(), frame_index)
+        return
+
     # 1. Run detection on the uploaded image
     print(f"Running detection on {args.image_path} using model {YOLO_MODEL_PATH}...")
     hands = detect_hands(args.image_path, YOLO_MODEL_PATH, GESTURE_ID_MAP)